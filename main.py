@@ -7,22 +7,18 @@ import logging
 import sys
 import os
 import uvicorn
-from dotenv import load_dotenv
-from pathlib import Path
-
-# Load .env file explicitly before importing settings
-project_root = Path(__file__).resolve().parent
-env_file = project_root / ".env"
-if env_file.exists():
-    load_dotenv(env_file)
-else:
-    load_dotenv()
+from importlib.util import find_spec
 
+# Importing the config loads the project's .env file
 from paraphrase_engine.config import settings
 from webhook_server import app
 
 logger = logging.getLogger(__name__)
 
+# C implementations of the event loop and HTTP parser, when installed
+UVICORN_LOOP = "uvloop" if find_spec("uvloop") is not None else "asyncio"
+UVICORN_HTTP = "httptools" if find_spec("httptools") is not None else "h11"
+
 def main():
     """Main entry point - uses webhook mode for production"""
     logger.info("=" * 60)
@@ -36,12 +32,14 @@ def main():
         sys.exit(1)
     
     port = int(os.getenv('PORT', '10000'))
-    logger.info(f"Starting Uvicorn server on host 0.0.0.0:{port}")
+    logger.info(f"Starting Uvicorn server on host 0.0.0.0:{port} (loop={UVICORN_LOOP}, http={UVICORN_HTTP})")
     try:
         uvicorn.run(
             app,
             host="0.0.0.0",
-            port=port
+            port=port,
+            loop=UVICORN_LOOP,
+            http=UVICORN_HTTP
         )
     except Exception as e:
         logger.error(f"Fatal error during Uvicorn startup: {e}", exc_info=True)
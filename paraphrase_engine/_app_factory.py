@@ -0,0 +1,121 @@
+"""
+Shared factory for python-telegram-bot Application objects
+"""
+
+import asyncio
+import functools
+from importlib.util import find_spec
+from typing import Any, Awaitable, Dict, Tuple, Union
+
+from telegram import Update
+from telegram.ext import Application, BaseUpdateProcessor
+from telegram.request import HTTPXRequest
+
+try:
+    import orjson
+except ImportError:
+    orjson = None
+
+# HTTP connection pool for outgoing Bot API calls (kept alive between requests)
+BOT_API_POOL_SIZE = 256
+BOT_API_POOL_TIMEOUT = 5.0
+BOT_API_CONNECT_TIMEOUT = 5.0
+BOT_API_READ_TIMEOUT = 20.0
+
+# HTTP/2 multiplexes concurrent calls over one TLS connection; httpx needs the
+# optional h2 package for it (pip install "httpx[http2]")
+BOT_API_HTTP_VERSION = "2" if find_spec("h2") is not None else "1.1"
+
+
+class ORJSONHTTPXRequest(HTTPXRequest):
+    """HTTPXRequest that parses Bot API responses with orjson"""
+
+    @staticmethod
+    def parse_json_payload(payload: bytes) -> Dict[str, Any]:
+        try:
+            return orjson.loads(payload)
+        except ValueError:
+            # Invalid UTF-8 or JSON: fall back to the stock parser and its error handling
+            return HTTPXRequest.parse_json_payload(payload)
+
+
+# Use orjson for response parsing when it is installed
+_REQUEST_CLASS = ORJSONHTTPXRequest if orjson is not None else HTTPXRequest
+
+
+class PerChatUpdateProcessor(BaseUpdateProcessor):
+    """
+    Process updates from different chats concurrently, and from one chat in order
+    
+    Handlers stay blocking, so a ConversationHandler sees every update of a
+    chat after the previous one has finished instead of dropping it while
+    the conversation is pending.
+    """
+    
+    def __init__(self, max_concurrent_updates: int):
+        super().__init__(max_concurrent_updates)
+        self._chat_locks: Dict[int, asyncio.Lock] = {}
+        self._chat_waiters: Dict[int, int] = {}
+    
+    async def do_process_update(self, update: object, coroutine: Awaitable[Any]) -> None:
+        chat = update.effective_chat if isinstance(update, Update) else None
+        if chat is None:
+            await coroutine
+            return
+        
+        chat_id = chat.id
+        lock = self._chat_locks.setdefault(chat_id, asyncio.Lock())
+        self._chat_waiters[chat_id] = self._chat_waiters.get(chat_id, 0) + 1
+        try:
+            async with lock:
+                await coroutine
+        finally:
+            # Drop the lock once no update of the chat is queued on it
+            self._chat_waiters[chat_id] -= 1
+            if not self._chat_waiters[chat_id]:
+                del self._chat_waiters[chat_id]
+                del self._chat_locks[chat_id]
+    
+    async def initialize(self) -> None:
+        pass
+    
+    async def shutdown(self) -> None:
+        pass
+
+
+@functools.lru_cache(maxsize=1)
+def get_requests() -> Tuple[HTTPXRequest, HTTPXRequest]:
+    """
+    Return the process-wide (request, get_updates_request) pair.
+
+    Outgoing calls and long-polling getUpdates use separate pools so a
+    pending poll never holds a connection needed for replies.
+    """
+    request = _REQUEST_CLASS(
+        connection_pool_size=BOT_API_POOL_SIZE,
+        pool_timeout=BOT_API_POOL_TIMEOUT,
+        connect_timeout=BOT_API_CONNECT_TIMEOUT,
+        read_timeout=BOT_API_READ_TIMEOUT,
+        http_version=BOT_API_HTTP_VERSION,
+    )
+    get_updates_request = _REQUEST_CLASS(
+        connection_pool_size=1,
+        connect_timeout=BOT_API_CONNECT_TIMEOUT,
+        read_timeout=BOT_API_READ_TIMEOUT,
+    )
+    return request, get_updates_request
+
+
+def build_app(
+    token: str, concurrent_updates: Union[bool, int, BaseUpdateProcessor] = False
+) -> Application:
+    """Build an Application on top of the shared HTTP connection pools"""
+    request, get_updates_request = get_requests()
+    return (
+        Application.builder()
+        .token(token)
+        .request(request)
+        .get_updates_request(get_updates_request)
+        .concurrent_updates(concurrent_updates)
+        .build()
+    )
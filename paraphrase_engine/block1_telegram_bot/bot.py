@@ -6,7 +6,7 @@ The only point of entry for the end user
 import os
 import asyncio
 from pathlib import Path
-from typing import Dict, List, Optional
+from typing import Awaitable, Callable, Dict, List, Optional
 from telegram import Update, Document, Bot, InlineKeyboardButton, InlineKeyboardMarkup, BotCommand
 from telegram.ext import (
     Application,
@@ -21,6 +21,7 @@ import logging
 from datetime import datetime
 
 from ..config import settings
+from .._app_factory import build_app
 from ..block2_orchestrator.task_manager import TaskManager
 from ..block5_logging.logger import SystemLogger
 from ..block4_document import PDFReportExtractor, PlagiarismFragment
@@ -46,7 +47,7 @@ class TelegramBotInterface:
         """Setup bot handlers - can be called before or after application creation"""
         # Create application if not exists
         if self.application is None:
-            self.application = Application.builder().token(settings.telegram_bot_token).build()
+            self.application = build_app(settings.telegram_bot_token)
         
         # Create conversation handler
         conv_handler = ConversationHandler(
@@ -986,8 +987,14 @@ class TelegramBotInterface:
         except Exception as e:
             logger.warning(f"⚠️ Не удалось установить команды бота: {e}")
     
-    def run(self):
-        """Run the bot in polling mode"""
+    def run(self, on_shutdown: Optional[Callable[[Application], Awaitable[None]]] = None):
+        """
+        Run the bot in polling mode
+        
+        Args:
+            on_shutdown: Optional coroutine run on the bot's event loop after the
+                         application has shut down (e.g. to close side servers)
+        """
         # Handlers are already set up in __init__
         # Set bot commands using post_init callback
         async def post_init(app: Application) -> None:
@@ -999,6 +1006,7 @@ class TelegramBotInterface:
         # drop_pending_updates=True ensures clean start
         if self.application:
             self.application.post_init = post_init
+            self.application.post_shutdown = on_shutdown
             self.application.run_polling(
                 allowed_updates=Update.ALL_TYPES,
                 drop_pending_updates=True
@@ -23,6 +23,10 @@ from ..block5_logging.logger import SystemLogger
 
 logger = logging.getLogger(__name__)
 
+# Compiled once at import: these run on every provider/evaluator response
+_PARAPHRASE_TAG_RE = re.compile(r'<paraphrase>(.*?)</paraphrase>', re.DOTALL)
+_JSON_OBJECT_RE = re.compile(r'\{.*\}', re.DOTALL)
+
 
 @dataclass
 class ParaphraseCandidate:
@@ -296,7 +300,7 @@ Provide ONLY the refined version, without any explanations.
             
             if paraphrased and paraphrased.strip():
                 # Extract text from <paraphrase> tags if present
-                paraphrase_match = re.search(r'<paraphrase>(.*?)</paraphrase>', paraphrased, re.DOTALL)
+                paraphrase_match = _PARAPHRASE_TAG_RE.search(paraphrased)
                 if paraphrase_match:
                     paraphrased = paraphrase_match.group(1).strip()
                 else:
@@ -354,8 +358,7 @@ Provide ONLY the refined version, without any explanations.
             # Parse evaluation response
             try:
                 # Try to extract JSON from response
-                import re
-                json_match = re.search(r'\{.*\}', evaluation_response, re.DOTALL)
+                json_match = _JSON_OBJECT_RE.search(evaluation_response)
                 if json_match:
                     evaluation_data = json.loads(json_match.group())
                     best_index = evaluation_data.get("best_index", 0)
@@ -412,19 +415,20 @@ Provide ONLY the refined version, without any explanations.
     
     async def test_providers(self) -> Dict[str, bool]:
         """Test all configured providers"""
-        results = {}
         test_text = "This is a test sentence for provider validation."
         
-        for provider in self.providers:
+        async def check(provider) -> bool:
             try:
                 response = await provider.generate(
                     prompt=f"Echo this exactly: {test_text}",
                     temperature=0.1,
                     max_tokens=50
                 )
-                results[provider.name] = bool(response)
+                return bool(response)
             except Exception as e:
                 logger.error(f"Provider {provider.name} test failed: {e}")
-                results[provider.name] = False
+                return False
         
-        return results
+        # Провайдеры независимы — проверяем их параллельно
+        checks = await asyncio.gather(*(check(provider) for provider in self.providers))
+        return {provider.name: ok for provider, ok in zip(self.providers, checks)}
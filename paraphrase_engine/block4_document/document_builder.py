@@ -4,6 +4,7 @@ Automatically replaces original fragments with paraphrased ones in .docx documen
 """
 
 import os
+import re
 import logging
 from typing import List, Tuple, Optional
 from pathlib import Path
@@ -18,6 +19,15 @@ from ..block5_logging.logger import SystemLogger
 
 logger = logging.getLogger(__name__)
 
+# Patterns used by _normalize_text, which runs per paragraph and per character
+# during fragment matching, so they are compiled once at import time
+_CITATION_RE = re.compile(r'\[\d+[,\s]*(?:[сc]\.\s*)?\d*\]')  # [39, c. 126] or [14]
+_PAGE_REF_RE = re.compile(r'[сc]\.\s*\d+')  # с. 51
+_LEADING_NUMBERS_RE = re.compile(r'^\d+\s+\d+\s*')  # "61 19 января" -> "19 января"
+_STANDALONE_NUMBER_RE = re.compile(r'^\d+\s*$', re.MULTILINE)  # Standalone numbers on lines
+_HORIZONTAL_SPACE_RE = re.compile(r'[ \t]+')
+_KEYWORD_RE = re.compile(r'\b\w{4,}\b')  # Words with 4+ characters
+
 
 class DocumentBuilder:
     """Handles document manipulation and fragment replacement"""
@@ -275,8 +285,7 @@ class DocumentBuilder:
         # If still not found, try keyword-based search (last resort)
         if not replacement_made:
             # Extract meaningful words from the fragment (remove common words, numbers, short words)
-            import re
-            words = re.findall(r'\b\w{4,}\b', original_normalized)  # Words with 4+ characters
+            words = _KEYWORD_RE.findall(original_normalized)  # Words with 4+ characters
             if len(words) >= 3:  # Need at least 3 meaningful words
                 # Search for paragraphs containing at least 2 of these words
                 for paragraph in doc.paragraphs:
@@ -644,18 +653,17 @@ class DocumentBuilder:
         Uses soft normalization to preserve text structure
         Removes PDF artifacts like page numbers and citations
         """
-        import re
         # Remove PDF artifacts: page numbers, citations like [39, c. 126], [14], etc.
         # Pattern: [number, c. number] or [number] or "с. number" or standalone numbers
-        text = re.sub(r'\[\d+[,\s]*(?:[сc]\.\s*)?\d*\]', '', text)  # [39, c. 126] or [14]
-        text = re.sub(r'[сc]\.\s*\d+', '', text)  # с. 51
-        text = re.sub(r'^\d+\s+\d+\s*', '', text)  # "61 19 января" -> "19 января"
-        text = re.sub(r'^\d+\s*$', '', text, flags=re.MULTILINE)  # Standalone numbers on lines
+        text = _CITATION_RE.sub('', text)
+        text = _PAGE_REF_RE.sub('', text)
+        text = _LEADING_NUMBERS_RE.sub('', text)
+        text = _STANDALONE_NUMBER_RE.sub('', text)
         
         # Normalize line endings first
         text = text.replace('\r\n', ' ').replace('\r', ' ').replace('\n', ' ')
         # Replace multiple spaces/tabs with single space (but preserve single spaces)
-        text = re.sub(r'[ \t]+', ' ', text)
+        text = _HORIZONTAL_SPACE_RE.sub(' ', text)
         # Strip leading/trailing whitespace
         text = text.strip()
         return text
@@ -737,7 +745,6 @@ class DocumentBuilder:
         
         # Find first word in normalized text (case-insensitive search)
         # Since _normalize_text doesn't lowercase, we need case-insensitive search
-        import re
         first_match = re.search(re.escape(first_word), normalized_full, re.IGNORECASE)
         if not first_match:
             return None
@@ -1,5 +1,6 @@
 """Block 5: Logging and Monitoring"""
 
 from .logger import SystemLogger
+from .setup import configure_logging
 
-__all__ = ["SystemLogger"]
+__all__ = ["SystemLogger", "configure_logging"]
@@ -0,0 +1,55 @@
+"""
+Root logging setup shared by the bot entry points and standalone scripts
+"""
+
+import atexit
+import logging
+import logging.handlers
+import queue
+from typing import Optional
+
+# Handler and listener installed by the last configure_logging() call
+_queue_handler: Optional[logging.handlers.QueueHandler] = None
+_listener: Optional[logging.handlers.QueueListener] = None
+
+
+def _stop_listener():
+    """Flush queued records and close the output handlers"""
+    if _listener is not None:
+        _listener.stop()
+        for handler in _listener.handlers:
+            handler.close()
+
+
+def configure_logging(log_level: str, log_file: Optional[str] = 'paraphrase_engine.log'):
+    """
+    Configure root logging for the application
+    
+    Records are only enqueued on the calling thread; a background
+    QueueListener does the console and file writes. Calling it again
+    replaces the previous setup instead of adding a second one.
+    """
+    global _queue_handler, _listener
+    
+    formatter = logging.Formatter('%(asctime)s - %(name)s - %(levelname)s - %(message)s')
+    handlers = [logging.StreamHandler()]
+    if log_file:
+        handlers.append(logging.FileHandler(log_file, delay=True))
+    for handler in handlers:
+        handler.setFormatter(formatter)
+    
+    root_logger = logging.getLogger()
+    if _queue_handler is not None:
+        root_logger.removeHandler(_queue_handler)
+        _stop_listener()
+    else:
+        atexit.register(_stop_listener)
+    
+    log_queue = queue.SimpleQueue()
+    _listener = logging.handlers.QueueListener(log_queue, *handlers)
+    _queue_handler = logging.handlers.QueueHandler(log_queue)
+    
+    root_logger.setLevel(getattr(logging, log_level))
+    root_logger.addHandler(_queue_handler)
+    
+    _listener.start()
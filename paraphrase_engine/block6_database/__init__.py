@@ -3,7 +3,7 @@ Block 6: Database Management
 Handles persistent storage of paraphrased documents and their versions
 """
 
-from .database import DatabaseManager, ParaphrasedDocument
+from .database import DatabaseManager, DocumentSummary, ParaphrasedDocument
 
-__all__ = ['DatabaseManager', 'ParaphrasedDocument']
+__all__ = ['DatabaseManager', 'DocumentSummary', 'ParaphrasedDocument']
 
@@ -1,5 +1,5 @@
 """Configuration module for Paraphrase Engine"""
 
-from .settings import settings
+from .settings import settings, settings_snapshot
 
-__all__ = ["settings"]
+__all__ = ["settings", "settings_snapshot"]
@@ -4,7 +4,10 @@ Compatible with Python 3.13+ without pydantic-settings
 """
 
 import os
+from functools import lru_cache
 from pathlib import Path
+from types import MappingProxyType
+from typing import Any, Mapping
 from dotenv import load_dotenv
 
 # Find and load .env file from project root
@@ -93,3 +96,9 @@ class Settings:
 # Create settings instance
 settings = Settings()
 
+
+@lru_cache(maxsize=None)
+def settings_snapshot(*names: str) -> Mapping[str, Any]:
+    """Read-only mapping of the named settings, built once per process"""
+    return MappingProxyType({name: getattr(settings, name) for name in names})
+
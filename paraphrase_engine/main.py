@@ -2,56 +2,66 @@
 Main entry point for Paraphrase Engine v1.0
 """
 
+import asyncio
 import logging
 import sys
-import threading
-from http.server import HTTPServer, BaseHTTPRequestHandler
 import os
 
-from .config import settings
-from .block1_telegram_bot import TelegramBotInterface
+logger = logging.getLogger(__name__)
 
-# Configure logging
-logging.basicConfig(
-    level=getattr(logging, settings.log_level),
-    format='%(asctime)s - %(name)s - %(levelname)s - %(message)s',
-    handlers=[
-        logging.StreamHandler(),
-        logging.FileHandler('paraphrase_engine.log')
-    ]
-)
 
-logger = logging.getLogger(__name__)
+HEALTH_BODY = b'{"status":"ok","service":"paraphrase-engine"}'
+HEALTH_OK_RESPONSE = (
+    b"HTTP/1.1 200 OK\r\n"
+    b"Content-Type: application/json\r\n"
+    b"Content-Length: " + str(len(HEALTH_BODY)).encode() + b"\r\n"
+    b"Connection: close\r\n"
+    b"\r\n" + HEALTH_BODY
+)
+HEALTH_NOT_FOUND_RESPONSE = (
+    b"HTTP/1.1 404 Not Found\r\n"
+    b"Content-Length: 0\r\n"
+    b"Connection: close\r\n"
+    b"\r\n"
+)
+HEALTH_PATHS = (b"/health", b"/")
 
 
-class HealthCheckHandler(BaseHTTPRequestHandler):
-    """Simple HTTP handler for health checks"""
-    
-    def do_GET(self):
-        """Handle GET requests"""
-        if self.path == '/health' or self.path == '/':
-            self.send_response(200)
-            self.send_header('Content-type', 'application/json')
-            self.end_headers()
-            self.wfile.write(b'{"status":"ok","service":"paraphrase-engine"}')
-        else:
-            self.send_response(404)
-            self.end_headers()
-    
-    def log_message(self, format, *args):
-        """Suppress default logging"""
+async def handle_health_request(reader: asyncio.StreamReader, writer: asyncio.StreamWriter):
+    """Answer a single health check request with a prebuilt response"""
+    try:
+        request_line = await reader.readline()
+        # Drain headers so closing the socket does not reset the connection
+        while (await reader.readline()) not in (b"\r\n", b"\n", b""):
+            pass
+        
+        parts = request_line.split()
+        path = parts[1] if len(parts) > 1 else b""
+        writer.write(HEALTH_OK_RESPONSE if path in HEALTH_PATHS else HEALTH_NOT_FOUND_RESPONSE)
+        await writer.drain()
+    except (ConnectionError, asyncio.LimitOverrunError, ValueError):
         pass
+    finally:
+        writer.close()
 
 
-def start_health_server(port):
-    """Start a simple HTTP server for health checks"""
-    server = HTTPServer(('0.0.0.0', port), HealthCheckHandler)
+async def start_health_server(port: int) -> asyncio.AbstractServer:
+    """Start the health check server on the running event loop"""
+    server = await asyncio.start_server(handle_health_request, '0.0.0.0', port)
     logger.info(f"Health check server started on port {port}")
-    server.serve_forever()
+    return server
 
 
 def main():
     """Main application entry point"""
+    # Config and the bot stack are imported here rather than at module level
+    # so importing this module (e.g. for the health server) stays cheap
+    from .config import settings
+    from .block1_telegram_bot import TelegramBotInterface
+    from .block5_logging import configure_logging
+    
+    configure_logging(settings.log_level)
+    
     logger.info("=" * 60)
     logger.info("Starting Paraphrase Engine v1.0")
     logger.info("=" * 60)
@@ -89,16 +99,22 @@ def main():
         logger.warning("Google Sheets not configured - using local logging only")
     
     try:
-        # Start health check server in a separate thread
+        # The health check server shares the bot's event loop instead of a thread.
+        # It starts listening before any Telegram API call, so a slow or failing
+        # bot startup never keeps the port closed
         port = int(os.getenv('PORT', '10000'))
-        health_thread = threading.Thread(target=start_health_server, args=(port,), daemon=True)
-        health_thread.start()
-        logger.info(f"Health check server running on port {port}")
+        loop = asyncio.new_event_loop()
+        asyncio.set_event_loop(loop)
+        health_server = loop.run_until_complete(start_health_server(port))
+        
+        async def on_shutdown(app) -> None:
+            health_server.close()
+            await health_server.wait_closed()
         
-        # Create and run the bot
+        # Create and run the bot; run_polling picks up the loop set above
         bot = TelegramBotInterface()
         logger.info("Starting Telegram bot...")
-        bot.run()
+        bot.run(on_shutdown=on_shutdown)
         
     except KeyboardInterrupt:
         logger.info("Received interrupt signal, shutting down...")
@@ -3,38 +3,130 @@
 Simple working version of the bot without complex dependencies
 """
 
+import os
 import sys
 from pathlib import Path
 import logging
 import asyncio
+from secrets import token_hex
+from collections import OrderedDict
+from dataclasses import dataclass, field
+from typing import List, Optional
 
 # Ensure project root is on sys.path
 project_root = Path(__file__).resolve().parent
 if str(project_root) not in sys.path:
     sys.path.insert(0, str(project_root))
 
+import aiofiles
 from telegram import Update
-from telegram.ext import Application, CommandHandler, MessageHandler, filters, ContextTypes, ConversationHandler
+from telegram.ext import CommandHandler, MessageHandler, filters, ContextTypes, ConversationHandler
 from paraphrase_engine.config import settings
+from paraphrase_engine.block5_logging import configure_logging
+from paraphrase_engine._app_factory import PerChatUpdateProcessor, build_app
 
-# Configure logging
-logging.basicConfig(
-    level=logging.INFO,
-    format='%(asctime)s - %(name)s - %(levelname)s - %(message)s'
-)
+try:
+    import uvloop
+except ImportError:
+    uvloop = None
+
+# Configure logging; records are written by a background listener thread
+configure_logging("INFO", log_file=None)
 
 logger = logging.getLogger(__name__)
 
 # Conversation states
 WAITING_FOR_FILE, WAITING_FOR_FRAGMENTS = range(2)
 
+WELCOME_MESSAGE = (
+    "🎯 Welcome to Paraphrase Engine v1.0!\n\n"
+    "I will help you professionally rewrite text fragments while preserving "
+    "their academic style and meaning.\n\n"
+    "📋 *Step 1:* Please upload your document in .docx format."
+)
+SESSION_EXPIRED_MESSAGE = "❌ Session expired. Please start again with /start"
+INVALID_FORMAT_MESSAGE = "❌ Error: Please upload a .docx file only."
+FILE_TOO_LARGE_MESSAGE = "❌ Error: File size exceeds 10MB limit."
+DOWNLOADING_MESSAGE = "📥 Downloading file..."
+FILE_ACCEPTED_TEMPLATE = (
+    "✅ File `{file_name}` accepted.\n\n"
+    "📋 *Step 2:* Now enter the text fragments to be rephrased.\n"
+    "⚠️ *Important:* Each fragment must be on a new line."
+)
+DOCUMENT_ERROR_MESSAGE = "❌ Error: Unable to process the document. Please try again."
+NO_FRAGMENTS_MESSAGE = "❌ No fragments detected. Please enter text with each fragment on a new line."
+FRAGMENTS_RECEIVED_TEMPLATE = (
+    "✅ {count} fragment(s) received.\n"
+    "⏳ Starting work. Estimated time: ~{minutes} minutes.\n"
+    "Please wait..."
+)
+PROCESSING_COMPLETE_MESSAGE = (
+    "✅ Processing complete!\n\n"
+    "Note: This is a simplified version. The full paraphrasing functionality "
+    "is available in the complete bot.\n\n"
+    "To use the full version, please check the logs for any initialization errors."
+)
+FRAGMENTS_ERROR_MESSAGE = "❌ Error: Unable to process fragments. Please try again."
+CANCEL_MESSAGE = "❌ Operation cancelled. Use /start to begin again."
+UNEXPECTED_ERROR_MESSAGE = "❌ An unexpected error occurred. Please try again with /start"
+
+MAX_FILE_SIZE_BYTES = 10 * 1024 * 1024  # 10MB limit
+
+# Uploaded documents are stored here until processing is done
+TEMP_DIR = Path("temp_files")
+TEMP_DIR.mkdir(parents=True, exist_ok=True)
+TEMP_DIR_STR = str(TEMP_DIR.resolve())
+
+# Pre-opened handle to the temp dir: uploads are created relative to it
+# (openat) instead of resolving the full path on every upload. POSIX only.
+if os.open in os.supports_dir_fd:
+    TEMP_DIR_FD: Optional[int] = os.open(TEMP_DIR_STR, os.O_RDONLY | getattr(os, "O_DIRECTORY", 0))
+else:
+    TEMP_DIR_FD = None
+
+
+def _open_in_temp_dir(name: str, flags: int) -> int:
+    """Opener for files inside TEMP_DIR, relative to TEMP_DIR_FD"""
+    return os.open(name, flags, 0o666, dir_fd=TEMP_DIR_FD)
+
+# Upper bound on concurrently tracked user sessions (least recently used are dropped)
+MAX_SESSIONS = 10000
+
+# Number of updates processed at once across all chats (one at a time per chat)
+CONCURRENT_UPDATES = 256
+
+
+@dataclass(slots=True)
+class Session:
+    """Conversation state for a single chat"""
+    chat_id: int
+    user_name: str
+    file_path: Optional[str] = None
+    file_name: Optional[str] = None
+    fragments: List[str] = field(default_factory=list)
+
+
 class SimpleBot:
     """Simple bot without complex dependencies"""
     
     def __init__(self):
-        self.user_sessions = {}
+        self.user_sessions: "OrderedDict[int, Session]" = OrderedDict()
         logger.info("Simple bot initialized")
     
+    def _get_session(self, chat_id: int) -> Optional[Session]:
+        """Return the chat's session and mark it as recently used"""
+        session = self.user_sessions.get(chat_id)
+        if session is not None:
+            self.user_sessions.move_to_end(chat_id)
+        return session
+    
+    def _store_session(self, session: Session) -> None:
+        """Store a session, evicting the least recently used ones beyond MAX_SESSIONS"""
+        self.user_sessions[session.chat_id] = session
+        self.user_sessions.move_to_end(session.chat_id)
+        while len(self.user_sessions) > MAX_SESSIONS:
+            self.user_sessions.popitem(last=False)
+    
     async def start_command(self, update: Update, context: ContextTypes.DEFAULT_TYPE) -> int:
         """Handle /start command"""
         try:
@@ -44,22 +136,10 @@ class SimpleBot:
             logger.info(f"Start command from user {user_name} (ID: {chat_id})")
             
             # Initialize session
-            self.user_sessions[chat_id] = {
-                "chat_id": chat_id,
-                "user_name": user_name,
-                "file_path": None,
-                "fragments": []
-            }
-            
-            welcome_message = (
-                "🎯 Welcome to Paraphrase Engine v1.0!\n\n"
-                "I will help you professionally rewrite text fragments while preserving "
-                "their academic style and meaning.\n\n"
-                "📋 *Step 1:* Please upload your document in .docx format."
-            )
+            self._store_session(Session(chat_id=chat_id, user_name=user_name))
             
             await update.message.reply_text(
-                welcome_message,
+                WELCOME_MESSAGE,
                 parse_mode='Markdown'
             )
             
@@ -67,7 +147,7 @@ class SimpleBot:
             return WAITING_FOR_FILE
             
         except Exception as e:
-            logger.error(f"Error in start command: {e}", exc_info=True)
+            logger.error(f"Error in start command: {e}", exc_info=logger.isEnabledFor(logging.DEBUG))
             await update.message.reply_text(
                 f"❌ Error: {str(e)}\n\nPlease try again with /start"
             )
@@ -77,129 +157,102 @@ class SimpleBot:
         """Handle document upload"""
         try:
             chat_id = update.effective_chat.id
+            session = self._get_session(chat_id)
             
-            if chat_id not in self.user_sessions:
-                await update.message.reply_text(
-                    "❌ Session expired. Please start again with /start"
-                )
+            if session is None:
+                await update.message.reply_text(SESSION_EXPIRED_MESSAGE)
                 return ConversationHandler.END
             
             document = update.message.document
             
             # Validate file format
             if not document.file_name.endswith('.docx'):
-                await update.message.reply_text(
-                    "❌ Error: Please upload a .docx file only."
-                )
+                await update.message.reply_text(INVALID_FORMAT_MESSAGE)
                 return WAITING_FOR_FILE
             
             # Check file size
-            file_size_mb = document.file_size / (1024 * 1024)
-            if file_size_mb > 10:  # 10MB limit
-                await update.message.reply_text(
-                    "❌ Error: File size exceeds 10MB limit."
-                )
+            if document.file_size > MAX_FILE_SIZE_BYTES:
+                await update.message.reply_text(FILE_TOO_LARGE_MESSAGE)
                 return WAITING_FOR_FILE
             
             # Download and save file
-            await update.message.reply_text("📥 Downloading file...")
+            await update.message.reply_text(DOWNLOADING_MESSAGE)
             
             file = await context.bot.get_file(document.file_id)
             
             # Create unique file path
-            from datetime import datetime
-            timestamp = datetime.now().strftime("%Y%m%d_%H%M%S")
-            file_name = f"{chat_id}_{timestamp}_{document.file_name}"
-            file_path = Path("temp_files") / file_name
-            
-            # Ensure directory exists
-            file_path.parent.mkdir(parents=True, exist_ok=True)
+            file_name = f"{chat_id}_{token_hex(4)}_{document.file_name}"
+            file_path = f"{TEMP_DIR_STR}/{file_name}"
             
-            # Download file
-            await file.download_to_drive(str(file_path))
+            # Download into memory and write the file without blocking the event loop
+            content = await file.download_as_bytearray()
+            if TEMP_DIR_FD is not None:
+                upload = aiofiles.open(file_name, 'wb', opener=_open_in_temp_dir)
+            else:
+                upload = aiofiles.open(file_path, 'wb')
+            async with upload as out:
+                await out.write(content)
             
             # Store in session
-            self.user_sessions[chat_id]["file_path"] = str(file_path)
-            self.user_sessions[chat_id]["file_name"] = document.file_name
+            session.file_path = file_path
+            session.file_name = document.file_name
             
             await update.message.reply_text(
-                f"✅ File `{document.file_name}` accepted.\n\n"
-                "📋 *Step 2:* Now enter the text fragments to be rephrased.\n"
-                "⚠️ *Important:* Each fragment must be on a new line.",
+                FILE_ACCEPTED_TEMPLATE.format(file_name=document.file_name),
                 parse_mode='Markdown'
             )
             
             return WAITING_FOR_FRAGMENTS
             
         except Exception as e:
-            logger.error(f"Error handling document: {e}", exc_info=True)
-            await update.message.reply_text(
-                "❌ Error: Unable to process the document. Please try again."
-            )
+            logger.error(f"Error handling document: {e}", exc_info=logger.isEnabledFor(logging.DEBUG))
+            await update.message.reply_text(DOCUMENT_ERROR_MESSAGE)
             return WAITING_FOR_FILE
     
     async def handle_fragments(self, update: Update, context: ContextTypes.DEFAULT_TYPE) -> int:
         """Handle text fragments input"""
         try:
             chat_id = update.effective_chat.id
+            session = self._get_session(chat_id)
             
-            if chat_id not in self.user_sessions:
-                await update.message.reply_text(
-                    "❌ Session expired. Please start again with /start"
-                )
+            if session is None:
+                await update.message.reply_text(SESSION_EXPIRED_MESSAGE)
                 return ConversationHandler.END
             
             text = update.message.text
             
             # Parse fragments (split by newline)
-            fragments = [f.strip() for f in text.split('\n') if f.strip()]
+            fragments = list(filter(None, map(str.strip, text.splitlines())))
             
             if not fragments:
-                await update.message.reply_text(
-                    "❌ No fragments detected. Please enter text with each fragment on a new line."
-                )
+                await update.message.reply_text(NO_FRAGMENTS_MESSAGE)
                 return WAITING_FOR_FRAGMENTS
             
             # Store fragments
-            self.user_sessions[chat_id]["fragments"] = fragments
+            session.fragments = fragments
             
             # Send confirmation
             estimated_time = max(5, len(fragments) * 2)  # Rough estimate
             await update.message.reply_text(
-                f"✅ {len(fragments)} fragment(s) received.\n"
-                f"⏳ Starting work. Estimated time: ~{estimated_time} minutes.\n"
-                f"Please wait..."
+                FRAGMENTS_RECEIVED_TEMPLATE.format(count=len(fragments), minutes=estimated_time)
             )
             
-            # For now, just simulate processing
-            await asyncio.sleep(2)  # Simulate processing time
-            
-            await update.message.reply_text(
-                "✅ Processing complete!\n\n"
-                "Note: This is a simplified version. The full paraphrasing functionality "
-                "is available in the complete bot.\n\n"
-                "To use the full version, please check the logs for any initialization errors."
-            )
+            await update.message.reply_text(PROCESSING_COMPLETE_MESSAGE)
             
             return ConversationHandler.END
             
         except Exception as e:
-            logger.error(f"Error handling fragments: {e}", exc_info=True)
-            await update.message.reply_text(
-                "❌ Error: Unable to process fragments. Please try again."
-            )
+            logger.error(f"Error handling fragments: {e}", exc_info=logger.isEnabledFor(logging.DEBUG))
+            await update.message.reply_text(FRAGMENTS_ERROR_MESSAGE)
             return WAITING_FOR_FRAGMENTS
     
     async def cancel_command(self, update: Update, context: ContextTypes.DEFAULT_TYPE) -> int:
         """Handle /cancel command"""
         chat_id = update.effective_chat.id
         
-        if chat_id in self.user_sessions:
-            del self.user_sessions[chat_id]
+        self.user_sessions.pop(chat_id, None)
         
-        await update.message.reply_text(
-            "❌ Operation cancelled. Use /start to begin again."
-        )
+        await update.message.reply_text(CANCEL_MESSAGE)
         
         return ConversationHandler.END
     
@@ -210,7 +263,7 @@ class SimpleBot:
         if update and update.effective_chat:
             await context.bot.send_message(
                 chat_id=update.effective_chat.id,
-                text="❌ An unexpected error occurred. Please try again with /start"
+                text=UNEXPECTED_ERROR_MESSAGE
             )
     
     def run(self):
@@ -218,7 +271,10 @@ class SimpleBot:
         logger.info("Creating Telegram application...")
         
         # Create application
-        self.application = Application.builder().token(settings.telegram_bot_token).build()
+        self.application = build_app(
+            settings.telegram_bot_token,
+            concurrent_updates=PerChatUpdateProcessor(CONCURRENT_UPDATES)
+        )
         
         # Create conversation handler
         conv_handler = ConversationHandler(
@@ -232,6 +288,8 @@ class SimpleBot:
                 ],
             },
             fallbacks=[CommandHandler('cancel', self.cancel_command)],
+            per_user=True,
+            per_chat=True,
         )
         
         # Add handlers
@@ -246,6 +304,10 @@ def main():
     """Main entry point for the simple bot"""
     logger.info("Starting Simple Paraphrase Engine Bot...")
     
+    if uvloop is not None:
+        asyncio.set_event_loop_policy(uvloop.EventLoopPolicy())
+        logger.info("Using uvloop event loop")
+    
     try:
         bot = SimpleBot()
         bot.run()
@@ -13,14 +13,13 @@ if str(project_root) not in sys.path:
     sys.path.insert(0, str(project_root))
 
 from telegram import Update
-from telegram.ext import Application, CommandHandler, MessageHandler, filters, ContextTypes, ConversationHandler
+from telegram.ext import CommandHandler, MessageHandler, filters, ContextTypes, ConversationHandler
 from paraphrase_engine.config import settings
+from paraphrase_engine.block5_logging import configure_logging
+from paraphrase_engine._app_factory import build_app
 
-# Configure logging
-logging.basicConfig(
-    level=logging.INFO,
-    format='%(asctime)s - %(name)s - %(levelname)s - %(message)s'
-)
+# Configure logging; records are written by a background listener thread
+configure_logging("INFO", log_file=None)
 
 logger = logging.getLogger(__name__)
 
@@ -81,7 +80,7 @@ def main():
     try:
         # Test creating application
         logger.info("Creating Telegram application...")
-        application = Application.builder().token(settings.telegram_bot_token).build()
+        application = build_app(settings.telegram_bot_token)
         logger.info("✅ Application created successfully")
         
         # Test creating conversation handler
@@ -3,6 +3,7 @@
 Test Google Sheets integration for Paraphrase Engine bot
 """
 
+import functools
 import os
 import sys
 from pathlib import Path
@@ -10,6 +11,33 @@ from pathlib import Path
 # Add project root to path
 sys.path.insert(0, str(Path(__file__).parent))
 
+TOKEN_FILE = "token.json"
+SCOPES = ["https://www.googleapis.com/auth/spreadsheets.readonly"]
+
+
+@functools.lru_cache(maxsize=1)
+def _get_creds():
+    """Load OAuth credentials once per process, refreshing them only when expired"""
+    from google.auth.transport.requests import Request
+    from google.oauth2.credentials import Credentials
+    
+    creds = Credentials.from_authorized_user_file(TOKEN_FILE, SCOPES)
+    
+    # The refreshed token is read-only scoped, so it is never written back to
+    # token.json, which the bot's logger uses for writes
+    if not creds.valid and creds.expired and creds.refresh_token:
+        creds.refresh(Request())
+    
+    return creds
+
+
+@functools.lru_cache(maxsize=1)
+def _get_sheets_service():
+    """Build the Sheets API client once and reuse it"""
+    from googleapiclient.discovery import build
+    
+    return build("sheets", "v4", credentials=_get_creds()).spreadsheets()
+
 def test_google_sheets_integration():
     """Test if Google Sheets integration works with the bot's logger"""
     
@@ -32,11 +60,10 @@ def test_google_sheets_integration():
     print(f"✅ {credentials_file} found")
     
     # Test 3: Test OAuth credentials (using existing token.json)
-    token_file = "token.json"
-    if not os.path.exists(token_file):
-        print(f"❌ {token_file} not found - run quickstart.py first")
+    if not os.path.exists(TOKEN_FILE):
+        print(f"❌ {TOKEN_FILE} not found - run quickstart.py first")
         return False
-    print(f"✅ {token_file} found")
+    print(f"✅ {TOKEN_FILE} found")
     
     # Test 4: Test bot's SystemLogger Google Sheets initialization
     try:
@@ -61,21 +88,8 @@ def test_oauth_credentials():
     print("\n🔍 Testing OAuth credentials...")
     
     try:
-        from google.auth.transport.requests import Request
-        from google.oauth2.credentials import Credentials
-        from googleapiclient.discovery import build
-        
-        # Load credentials
-        creds = Credentials.from_authorized_user_file("token.json", 
-            ["https://www.googleapis.com/auth/spreadsheets.readonly"])
-        
-        if not creds.valid:
-            if creds.expired and creds.refresh_token:
-                creds.refresh(Request())
-        
         # Test API call
-        service = build("sheets", "v4", credentials=creds)
-        sheet = service.spreadsheets()
+        sheet = _get_sheets_service()
         
         # Try to get spreadsheet info (this will fail if credentials are invalid)
         spreadsheet_id = "1BxiMVs0XRA5nFMdKvBdBZjgmUUqptlbs74OgvE2upms"
@@ -4,6 +4,8 @@ Test imports to identify the error
 """
 
 import sys
+from concurrent.futures import ThreadPoolExecutor
+from importlib import import_module
 from pathlib import Path
 
 # Ensure project root is on sys.path
@@ -11,78 +13,72 @@ project_root = Path(__file__).resolve().parent
 if str(project_root) not in sys.path:
     sys.path.insert(0, str(project_root))
 
-print("Testing imports...")
+# Every module depends on config, so it is imported first on its own; a bad
+# config fails the run before any other module is loaded
+CONFIG_STEP = ("1. Testing config import...", "Config loaded", "Config",
+               "paraphrase_engine.config", "settings")
+
+# Independent modules are imported in parallel; results are reported in order
+IMPORT_STEPS = [
+    ("2. Testing SystemLogger import...", "SystemLogger imported", "SystemLogger",
+     "paraphrase_engine.block5_logging.logger", "SystemLogger"),
+    ("4. Testing AI providers import...", "AI providers imported", "AI providers",
+     "paraphrase_engine.block3_paraphrasing.ai_providers", "GoogleGeminiProvider"),
+    ("6. Testing ParaphrasingAgent import...", "ParaphrasingAgent imported", "ParaphrasingAgent",
+     "paraphrase_engine.block3_paraphrasing.agent_core", "ParaphrasingAgent"),
+    ("8. Testing TaskManager import...", "TaskManager imported", "TaskManager",
+     "paraphrase_engine.block2_orchestrator.task_manager", "TaskManager"),
+]
+IMPORT_WORKERS = 4
 
-try:
-    print("1. Testing config import...")
-    from paraphrase_engine.config import settings
-    print("✅ Config loaded successfully")
-except Exception as e:
-    print(f"❌ Config error: {e}")
-    sys.exit(1)
+# Each class is initialized right after its import is reported
+INIT_STEPS = {
+    "SystemLogger": ("3. Testing SystemLogger initialization...", "SystemLogger initialized",
+                     "SystemLogger init", lambda cls: cls()),
+    "GoogleGeminiProvider": ("5. Testing GoogleGeminiProvider initialization...",
+                             "GoogleGeminiProvider initialized", "GoogleGeminiProvider init",
+                             lambda cls: cls(api_key=settings.google_api_key)),
+    "ParaphrasingAgent": ("7. Testing ParaphrasingAgent initialization...",
+                          "ParaphrasingAgent initialized", "ParaphrasingAgent init",
+                          lambda cls: cls()),
+    "TaskManager": ("9. Testing TaskManager initialization...", "TaskManager initialized",
+                    "TaskManager init", lambda cls: cls()),
+}
 
-try:
-    print("2. Testing SystemLogger import...")
-    from paraphrase_engine.block5_logging.logger import SystemLogger
-    print("✅ SystemLogger imported successfully")
-except Exception as e:
-    print(f"❌ SystemLogger error: {e}")
-    sys.exit(1)
 
-try:
-    print("3. Testing SystemLogger initialization...")
-    logger = SystemLogger()
-    print("✅ SystemLogger initialized successfully")
-except Exception as e:
-    print(f"❌ SystemLogger init error: {e}")
-    sys.exit(1)
+def _import(module_name, attr):
+    return getattr(import_module(module_name), attr)
 
-try:
-    print("4. Testing AI providers import...")
-    from paraphrase_engine.block3_paraphrasing.ai_providers import GoogleGeminiProvider
-    print("✅ AI providers imported successfully")
-except Exception as e:
-    print(f"❌ AI providers error: {e}")
-    sys.exit(1)
 
-try:
-    print("5. Testing GoogleGeminiProvider initialization...")
-    provider = GoogleGeminiProvider(api_key=settings.google_api_key)
-    print("✅ GoogleGeminiProvider initialized successfully")
-except Exception as e:
-    print(f"❌ GoogleGeminiProvider init error: {e}")
-    sys.exit(1)
+def run_step(title, success, error, func):
+    """Run one step, exiting on failure"""
+    print(title)
+    try:
+        result = func()
+    except Exception as e:
+        print(f"❌ {error} error: {e}")
+        sys.exit(1)
+    print(f"✅ {success} successfully")
+    return result
 
-try:
-    print("6. Testing ParaphrasingAgent import...")
-    from paraphrase_engine.block3_paraphrasing.agent_core import ParaphrasingAgent
-    print("✅ ParaphrasingAgent imported successfully")
-except Exception as e:
-    print(f"❌ ParaphrasingAgent error: {e}")
-    sys.exit(1)
 
-try:
-    print("7. Testing ParaphrasingAgent initialization...")
-    agent = ParaphrasingAgent()
-    print("✅ ParaphrasingAgent initialized successfully")
-except Exception as e:
-    print(f"❌ ParaphrasingAgent init error: {e}")
-    sys.exit(1)
+print("Testing imports...")
+
+title, success, error, module_name, attr = CONFIG_STEP
+settings = run_step(title, success, error, lambda: _import(module_name, attr))
 
-try:
-    print("8. Testing TaskManager import...")
-    from paraphrase_engine.block2_orchestrator.task_manager import TaskManager
-    print("✅ TaskManager imported successfully")
-except Exception as e:
-    print(f"❌ TaskManager error: {e}")
-    sys.exit(1)
+# All four imports start at once, so a failing one does not stop the others:
+# the script exits with an error once they have finished loading
+executor = ThreadPoolExecutor(max_workers=IMPORT_WORKERS)
+futures = [
+    executor.submit(_import, module_name, attr)
+    for _, _, _, module_name, attr in IMPORT_STEPS
+]
 
-try:
-    print("9. Testing TaskManager initialization...")
-    task_manager = TaskManager()
-    print("✅ TaskManager initialized successfully")
-except Exception as e:
-    print(f"❌ TaskManager init error: {e}")
-    sys.exit(1)
+for (title, success, error, _, attr), future in zip(IMPORT_STEPS, futures):
+    cls = run_step(title, success, error, future.result)
+    init_title, init_success, init_error, init = INIT_STEPS[attr]
+    run_step(init_title, init_success, init_error, lambda: init(cls))
+executor.shutdown()
 
 print("\n🎉 All imports and initializations successful!")
@@ -13,6 +13,28 @@ sys.path.insert(0, str(Path(__file__).parent))
 from paraphrase_engine.config import settings
 from paraphrase_engine.block3_paraphrasing import ParaphrasingAgent
 
+# Upper bound on paraphrase requests in flight at once
+MAX_CONCURRENT_REQUESTS = 8
+
+TEST_TEXTS = [
+    "The implementation of artificial intelligence in modern healthcare "
+    "systems has demonstrated significant potential for improving diagnostic "
+    "accuracy and treatment outcomes.",
+    "The parties shall resolve any disputes arising from this agreement "
+    "through negotiation before resorting to judicial proceedings.",
+]
+
+
+async def paraphrase_all(agent, texts, style="scientific-legal"):
+    """Paraphrase texts concurrently, returning results or exceptions in input order"""
+    semaphore = asyncio.Semaphore(MAX_CONCURRENT_REQUESTS)
+    
+    async def run(text):
+        async with semaphore:
+            return await agent.paraphrase(text=text, style=style)
+    
+    return await asyncio.gather(*(run(text) for text in texts), return_exceptions=True)
+
 
 async def test_providers():
     """Test all configured AI providers"""
@@ -41,21 +63,15 @@ async def test_providers():
         print("Testing Paraphrasing Pipeline")
         print("=" * 60)
         
-        test_text = (
-            "The implementation of artificial intelligence in modern healthcare "
-            "systems has demonstrated significant potential for improving diagnostic "
-            "accuracy and treatment outcomes."
-        )
-        
-        print(f"\nOriginal text:\n{test_text}")
-        print("\nProcessing...")
+        print(f"\nProcessing {len(TEST_TEXTS)} text(s)...")
         
-        paraphrased = await agent.paraphrase(
-            text=test_text,
-            style="scientific-legal"
-        )
+        results = await paraphrase_all(agent, TEST_TEXTS)
         
-        print(f"\nParaphrased text:\n{paraphrased}")
+        for test_text, paraphrased in zip(TEST_TEXTS, results):
+            print(f"\nOriginal text:\n{test_text}")
+            if isinstance(paraphrased, Exception):
+                raise paraphrased
+            print(f"\nParaphrased text:\n{paraphrased}")
         
         print("\n✅ All tests completed successfully!")
         
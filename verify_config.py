@@ -11,76 +11,86 @@ project_root = Path(__file__).resolve().parent
 if str(project_root) not in sys.path:
     sys.path.insert(0, str(project_root))
 
-print("=" * 60)
-print("  Paraphrase Engine v1.0 - Configuration Verification")
-print("=" * 60)
-print()
+PROVIDERS = (
+    ("Google Gemini", "google_api_key"),
+    ("OpenAI", "openai_api_key"),
+    ("Anthropic", "anthropic_api_key"),
+)
+
+# The report is collected here and written to stdout in one call at the end,
+# including the sys.exit(1) paths
+out = []
+
+out.append("=" * 60)
+out.append("  Paraphrase Engine v1.0 - Configuration Verification")
+out.append("=" * 60)
+out.append("")
 
 try:
-    from paraphrase_engine.config import settings
+    from paraphrase_engine.config import settings_snapshot
     
-    print("✅ Configuration loaded successfully!")
-    print()
+    # Read every setting once up front
+    config = settings_snapshot(
+        "telegram_bot_token", "app_env", "log_level",
+        "max_file_size_mb", "file_retention_hours", "temp_files_dir",
+        *(attr for _, attr in PROVIDERS),
+    )
+    telegram_bot_token = config["telegram_bot_token"]
+    
+    out.append("✅ Configuration loaded successfully!")
+    out.append("")
     
     # Check Telegram Bot
-    if settings.telegram_bot_token:
-        token_preview = settings.telegram_bot_token[:20] + "..." + settings.telegram_bot_token[-5:]
-        print(f"✅ Telegram Bot Token: {token_preview}")
+    if telegram_bot_token:
+        token_preview = telegram_bot_token[:20] + "..." + telegram_bot_token[-5:]
+        out.append(f"✅ Telegram Bot Token: {token_preview}")
     else:
-        print("❌ Telegram Bot Token: NOT CONFIGURED")
+        out.append("❌ Telegram Bot Token: NOT CONFIGURED")
     
-    print()
+    out.append("")
     
     # Check AI Providers
-    print("AI Providers Configured:")
+    out.append("AI Providers Configured:")
     providers_count = 0
     
-    if settings.google_api_key:
-        print(f"  ✅ Google Gemini: {settings.google_api_key[:20]}...")
-        providers_count += 1
-    else:
-        print("  ⚪ Google Gemini: Not configured")
-    
-    if settings.openai_api_key:
-        print(f"  ✅ OpenAI: {settings.openai_api_key[:20]}...")
-        providers_count += 1
-    else:
-        print("  ⚪ OpenAI: Not configured")
-    
-    if settings.anthropic_api_key:
-        print(f"  ✅ Anthropic: {settings.anthropic_api_key[:20]}...")
-        providers_count += 1
-    else:
-        print("  ⚪ Anthropic: Not configured")
+    for name, attr in PROVIDERS:
+        key = config[attr]
+        if key:
+            out.append(f"  ✅ {name}: {key[:20]}...")
+            providers_count += 1
+        else:
+            out.append(f"  ⚪ {name}: Not configured")
     
-    print()
+    out.append("")
     
     if providers_count == 0:
-        print("❌ ERROR: No AI providers configured!")
-        print("   Please add at least one API key to .env")
+        out.append("❌ ERROR: No AI providers configured!")
+        out.append("   Please add at least one API key to .env")
         sys.exit(1)
     else:
-        print(f"✅ {providers_count} AI provider(s) ready")
+        out.append(f"✅ {providers_count} AI provider(s) ready")
     
-    print()
-    print("Other Settings:")
-    print(f"  Environment: {settings.app_env}")
-    print(f"  Log Level: {settings.log_level}")
-    print(f"  Max File Size: {settings.max_file_size_mb}MB")
-    print(f"  File Retention: {settings.file_retention_hours} hours")
-    print(f"  Temp Directory: {settings.temp_files_dir}")
+    out.append("")
+    out.append("Other Settings:")
+    out.append(f"  Environment: {config['app_env']}")
+    out.append(f"  Log Level: {config['log_level']}")
+    out.append(f"  Max File Size: {config['max_file_size_mb']}MB")
+    out.append(f"  File Retention: {config['file_retention_hours']} hours")
+    out.append(f"  Temp Directory: {config['temp_files_dir']}")
     
-    print()
-    print("=" * 60)
-    print("✅ All checks passed! Ready to run the bot.")
-    print("=" * 60)
-    print()
-    print("To start the bot, run:")
-    print("  python3 -m paraphrase_engine.main")
-    print()
+    out.append("")
+    out.append("=" * 60)
+    out.append("✅ All checks passed! Ready to run the bot.")
+    out.append("=" * 60)
+    out.append("")
+    out.append("To start the bot, run:")
+    out.append("  python3 -m paraphrase_engine.main")
+    out.append("")
     
 except Exception as e:
-    print(f"❌ Configuration Error: {e}")
-    print()
-    print("Please check your .env file and ensure all required values are set.")
+    out.append(f"❌ Configuration Error: {e}")
+    out.append("")
+    out.append("Please check your .env file and ensure all required values are set.")
     sys.exit(1)
+finally:
+    sys.stdout.write("\n".join(out) + "\n")
@@ -4,46 +4,74 @@ Compatible with Render deployment
 """
 
 import asyncio
+import json
 import logging
 import os
+from typing import Any, Awaitable, Callable, Dict, Optional, Set
+from contextlib import asynccontextmanager
 from fastapi import FastAPI, Request, Response
-from telegram import Update
-from dotenv import load_dotenv
-from pathlib import Path
-
-# Load .env file explicitly
-project_root = Path(__file__).resolve().parent
-env_file = project_root / ".env"
-if env_file.exists():
-    load_dotenv(env_file)
-else:
-    # Try loading from current directory
-    load_dotenv()
+from fastapi.responses import JSONResponse, ORJSONResponse
+from telegram import Bot, Update
+
+try:
+    import orjson
+except ImportError:
+    orjson = None
 
-from paraphrase_engine.config import settings
+# Importing the config loads the project's .env file
+from paraphrase_engine.config import settings_snapshot
 from paraphrase_engine.block1_telegram_bot.bot import TelegramBotInterface
+from paraphrase_engine._app_factory import PerChatUpdateProcessor
+
+# The settings this server needs, read once into a read-only mapping
+SETTINGS = settings_snapshot("telegram_bot_token", "app_env", "log_level")
+
+LOG_LEVEL_INT = getattr(logging, SETTINGS["log_level"], logging.INFO)
 
 # Basic logging setup
 logging.basicConfig(
-    level=getattr(logging, settings.log_level, "INFO"),
+    level=LOG_LEVEL_INT,
     format='%(asctime)s - %(name)s - %(levelname)s - %(message)s',
 )
 logger = logging.getLogger(__name__)
 
-# FastAPI app
-app = FastAPI()
+# Webhook bodies and JSON responses go through orjson when it is installed
+_json_loads = orjson.loads if orjson is not None else json.loads
+DEFAULT_RESPONSE_CLASS = ORJSONResponse if orjson is not None else JSONResponse
 
-logger.info("Initializing Telegram bot interface...")
-try:
-    # Bot setup
-    bot_interface = TelegramBotInterface()
-    logger.info("Telegram bot interface initialized successfully")
-except Exception as e:
-    logger.error(f"Failed to initialize Telegram bot interface: {e}", exc_info=True)
-    raise
+# Created in lifespan once the event loop is running
+bot_interface: Optional[TelegramBotInterface] = None
+# Resolved once in lifespan so the per-update path skips the attribute chain
+_bot: Optional[Bot] = None
+_application_process_update: Optional[Callable[[Update], Awaitable[None]]] = None
+
+# Updates are processed in background tasks so Telegram gets its 200 right away;
+# strong references keep running tasks from being garbage collected.
+# Different chats run concurrently, one chat's updates in arrival order, so
+# ConversationHandler states advance before that chat's next update is matched
+MAX_CONCURRENT_UPDATES = 256
+_pending_updates: Set[asyncio.Task] = set()
+_update_processor = PerChatUpdateProcessor(MAX_CONCURRENT_UPDATES)
+
+# Telegram updates are small JSON documents; anything else is dropped unparsed.
+# Rejected requests still get 200 so Telegram never retries them.
+MAX_UPDATE_BYTES = 1_048_576
+
+# How long shutdown waits for in-flight updates before dropping them
+SHUTDOWN_DRAIN_TIMEOUT = 10
 
 # Use the bot token as a secret path to avoid random requests
-SECRET_PATH = settings.telegram_bot_token
+SECRET_PATH = SETTINGS["telegram_bot_token"]
+# Mask the token in logs for security (show only first 4 and last 4 chars)
+MASKED_PATH = f"{SECRET_PATH[:4]}...{SECRET_PATH[-4:]}" if SECRET_PATH and len(SECRET_PATH) > 8 else "***"
+
+# Determine webhook URL - try multiple sources
+WEBHOOK_BASE_URL = (
+    os.getenv("RENDER_EXTERNAL_URL") or  # Render hosting
+    os.getenv("WEBHOOK_BASE_URL") or      # Custom environment variable
+    os.getenv("WEBHOOK_URL") or           # Alternative env var
+    "https://plagiatanet.by"              # Default domain
+)
 
 # Validate that token is configured
 if not SECRET_PATH:
@@ -51,36 +79,40 @@ if not SECRET_PATH:
 else:
     logger.info(f"Bot token configured (length: {len(SECRET_PATH)})")
 
-@app.on_event("startup")
-async def startup_event():
-    """On startup, set the webhook to point to this server."""
+@asynccontextmanager
+async def lifespan(app: FastAPI):
+    """Set the webhook on startup and remove it on shutdown."""
+    global bot_interface, _bot, _application_process_update
+    
     logger.info("Starting up webhook server...")
-    logger.info(f"APP_ENV: {settings.app_env}")
+    logger.info(f"APP_ENV: {SETTINGS['app_env']}")
+    
+    logger.info("Initializing Telegram bot interface...")
+    try:
+        # Bot setup
+        interface = TelegramBotInterface()
+        logger.info("Telegram bot interface initialized successfully")
+    except Exception as e:
+        logger.error(f"Failed to initialize Telegram bot interface: {e}", exc_info=True)
+        raise
     
     try:
-        await bot_interface.application.initialize()
+        await interface.application.initialize()
         logger.info("Bot application initialized successfully")
     except Exception as e:
         logger.error(f"Failed to initialize bot application: {e}", exc_info=True)
         raise
     
+    await _update_processor.initialize()
+    bot_interface = interface
+    _bot = interface.application.bot
+    _application_process_update = interface.application.process_update
+    
     if not SECRET_PATH:
         logger.error("TELEGRAM_BOT_TOKEN is empty! Cannot set webhook.")
-        return
-    
-    # Determine webhook URL - try multiple sources
-    webhook_base_url = (
-        os.getenv("RENDER_EXTERNAL_URL") or  # Render hosting
-        os.getenv("WEBHOOK_BASE_URL") or      # Custom environment variable
-        os.getenv("WEBHOOK_URL") or           # Alternative env var
-        "https://plagiatanet.by"              # Default domain
-    )
-    
-    if settings.app_env == "production":
-        webhook_url = f"{webhook_base_url}/{SECRET_PATH}"
-        # Mask the token in logs for security (show only first 4 and last 4 chars)
-        masked_path = f"{SECRET_PATH[:4]}...{SECRET_PATH[-4:]}" if len(SECRET_PATH) > 8 else "***"
-        masked_url = f"{webhook_base_url}/{masked_path}"
+    elif SETTINGS["app_env"] == "production":
+        webhook_url = f"{WEBHOOK_BASE_URL}/{SECRET_PATH}"
+        masked_url = f"{WEBHOOK_BASE_URL}/{MASKED_PATH}"
         logger.info(f"Setting webhook to {masked_url}")
         
         try:
@@ -90,54 +122,106 @@ async def startup_event():
             )
             logger.info(f"Webhook set successfully: {result}")
             
-            # Verify webhook info
-            webhook_info = await bot_interface.application.bot.get_webhook_info()
-            logger.info(f"Webhook info: URL={webhook_info.url}, pending_update_count={webhook_info.pending_update_count}")
+            # Verify webhook info (extra round-trip, opt-in via VERIFY_WEBHOOK=1)
+            if os.getenv("VERIFY_WEBHOOK") == "1":
+                webhook_info = await bot_interface.application.bot.get_webhook_info()
+                logger.info(f"Webhook info: URL={webhook_info.url}, pending_update_count={webhook_info.pending_update_count}")
         except Exception as e:
             logger.error(f"Failed to set webhook: {e}", exc_info=True)
     else:
         logger.warning("Not setting webhook in development mode. Set APP_ENV=production to enable.")
-
-@app.on_event("shutdown")
-async def shutdown_event():
-    """On shutdown, remove the webhook."""
-    if settings.app_env == "production":
+    
+    yield
+    
+    if SETTINGS["app_env"] == "production":
         logger.info("Deleting webhook")
         try:
             await bot_interface.application.bot.delete_webhook()
         except Exception as e:
             logger.error(f"Error deleting webhook: {e}", exc_info=True)
     
+    if _pending_updates:
+        logger.info(f"Waiting for {len(_pending_updates)} in-flight update(s)")
+        try:
+            await asyncio.wait_for(
+                asyncio.gather(*_pending_updates, return_exceptions=True),
+                timeout=SHUTDOWN_DRAIN_TIMEOUT
+            )
+        except asyncio.TimeoutError:
+            logger.warning(f"Dropping {len(_pending_updates)} in-flight update(s)")
+    
+    await _update_processor.shutdown()
+    
     logger.info("Shutting down bot application")
+    try:
+        await bot_interface.application.shutdown()
+    except Exception as e:
+        logger.error(f"Error shutting down bot application: {e}", exc_info=True)
 
-# Webhook endpoint - only create if token is configured
-if SECRET_PATH:
-    @app.post(f"/{SECRET_PATH}")
-    async def webhook(request: Request):
-        """Handles incoming updates from Telegram by passing them to the bot."""
-        try:
-            data = await request.json()
-            logger.debug(f"Received update: {data.get('update_id', 'unknown')}")
-            update = Update.de_json(data=data, bot=bot_interface.application.bot)
-            await bot_interface.application.process_update(update)
-            logger.debug(f"Successfully processed update {update.update_id}")
-        except Exception as e:
-            logger.error(f"Error processing update: {e}", exc_info=True)
+# FastAPI app
+app = FastAPI(lifespan=lifespan, default_response_class=DEFAULT_RESPONSE_CLASS)
+
+async def _process_update(data: Dict[str, Any]) -> None:
+    """Build an Update from the decoded body and run it through the bot."""
+    try:
+        update = Update.de_json(data=data, bot=_bot)
+        await _update_processor.process_update(update, _application_process_update(update))
+        if logger.isEnabledFor(logging.DEBUG):
+            logger.debug("Successfully processed update %s", update.update_id)
+    except Exception as e:
+        logger.error(f"Error processing update: {e}", exc_info=True)
+
+async def webhook(request: Request) -> Response:
+    """Handles incoming updates from Telegram by passing them to the bot."""
+    if bot_interface is None:
+        return Response(status_code=503)
+    
+    headers = request.headers
+    content_length = headers.get("content-length", "0")
+    if (
+        not content_length.isdigit()
+        or int(content_length) > MAX_UPDATE_BYTES
+        or not headers.get("content-type", "").startswith("application/json")
+    ):
+        logger.warning("Ignoring webhook request with unexpected size or content type")
         return Response(status_code=200)
+    
+    try:
+        body = await request.body()
+        if len(body) > MAX_UPDATE_BYTES:
+            logger.warning("Ignoring oversized webhook request")
+            return Response(status_code=200)
+        data = _json_loads(body)
+        if logger.isEnabledFor(logging.DEBUG):
+            logger.debug("Received update: %s", data.get("update_id", "unknown"))
+        task = asyncio.create_task(_process_update(data))
+        _pending_updates.add(task)
+        task.add_done_callback(_pending_updates.discard)
+    except Exception as e:
+        logger.error(f"Error parsing update: {e}", exc_info=True)
+    return Response(status_code=200)
+
+# Webhook endpoint - only create if token is configured. It is a plain
+# Starlette route: the handler takes the raw Request, so FastAPI's
+# dependency resolution and response handling would only add overhead.
+if SECRET_PATH:
+    app.add_route(f"/{SECRET_PATH}", webhook, methods=["POST"], include_in_schema=False)
 else:
     logger.warning("Webhook endpoint not created - TELEGRAM_BOT_TOKEN is not configured")
 
+# Static bodies for the probe endpoints, built once and reused for every request
+ROOT_RESPONSE = Response(
+    content=b'{"service":"Paraphrase Engine","status":"running","version":"1.0"}',
+    media_type="application/json"
+)
+HEALTH_RESPONSE = Response(content=b'{"status":"ok"}', media_type="application/json")
+
 @app.get("/")
 async def root():
     """Root endpoint to handle basic requests and reduce 404 noise in logs."""
-    return {
-        "service": "Paraphrase Engine",
-        "status": "running",
-        "version": "1.0"
-    }
+    return ROOT_RESPONSE
 
 @app.get("/health")
 async def health_check():
     """Health check endpoint for Render to ensure the service is live."""
-    return {"status": "ok"}
-
+    return HEALTH_RESPONSE